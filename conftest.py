@@ -66,3 +66,10 @@ for _fixture in INCLUDE_FIXTURES:
         if hasattr(module, "__all__")
         else {k: v for (k, v) in module.__dict__.items() if not k.startswith("_")}
     )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Wait for test directories that are deleted in background."""
+    from tests.utils import wait_for_background_deletions
+
+    wait_for_background_deletions()
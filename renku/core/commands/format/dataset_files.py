@@ -125,7 +125,7 @@ def json(records, **kwargs):
     for record in records:
         record.creators = record.dataset.creators
 
-    data = [DatasetFileDetailsJson().dump(record) for record in records]
+    data = DatasetFileDetailsJson(many=True).dump(records)
     return dumps(data, indent=2)
 
 
@@ -49,7 +49,7 @@ def jsonld(datasets, **kwargs):
 
 def json(datasets, **kwargs):
     """Format datasets as JSON."""
-    data = [DatasetDetailsJson().dump(dataset) for dataset in datasets]
+    data = DatasetDetailsJson(many=True).dump(datasets)
     return dumps(data, indent=2)
 
 
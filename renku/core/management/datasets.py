@@ -391,6 +391,8 @@ class DatasetsApiMixin(object):
                 urls=urls, destination_names=destination_names, destination=destination, extract=extract
             )
         else:
+            resolved_dataset_datadir = (self.path / dataset_datadir).resolve()
+
             for url in urls:
                 is_remote, is_git, url = _check_url(url)
 
@@ -412,7 +414,10 @@ class DatasetsApiMixin(object):
                             )
                         u = parse.urlparse(url)
                         new_files = self._add_from_local(
-                            dataset=dataset, path=u.path, external=external, destination=destination
+                            path=u.path,
+                            external=external,
+                            destination=destination,
+                            dataset_datadir=resolved_dataset_datadir,
                         )
                     else:  # Remote URL
                         new_files = self._add_from_url(url=url, destination=destination, extract=extract)
@@ -537,8 +542,12 @@ class DatasetsApiMixin(object):
 
         return False
 
-    def _add_from_local(self, dataset, path, external, destination):
-        """Add a file or directory from a local filesystem."""
+    def _add_from_local(self, path, external, destination, dataset_datadir: Path):
+        """Add a file or directory from a local filesystem.
+
+        ``dataset_datadir`` is the resolved data directory of the dataset; it is passed along so that it's not resolved
+        again for every sub-directory.
+        """
         src = Path(os.path.abspath(path))
 
         if not src.exists():
@@ -550,7 +559,7 @@ class DatasetsApiMixin(object):
         if src.is_dir():
             if dst.exists() and not dst.is_dir():
                 raise errors.ParameterError(f'Cannot copy directory to a file: "{dst}"')
-            if src == (self.path / get_dataset_data_dir(self, dataset)).resolve():
+            if src == dataset_datadir:
                 raise errors.ParameterError(f"Cannot add dataset's data directory recursively: {path}")
 
             if self.is_protected_path(src):
@@ -559,7 +568,9 @@ class DatasetsApiMixin(object):
             files = []
             for f in src.iterdir():
                 files.extend(
-                    self._add_from_local(dataset=dataset, path=os.path.abspath(f), external=external, destination=dst)
+                    self._add_from_local(
+                        path=os.path.abspath(f), external=external, destination=dst, dataset_datadir=dataset_datadir
+                    )
                 )
             return files
         else:
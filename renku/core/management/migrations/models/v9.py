@@ -22,7 +22,7 @@ import os
 import pathlib
 import uuid
 from pathlib import Path
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 
 import attr
 from attr.validators import instance_of
@@ -611,7 +611,7 @@ class Dataset(Entity, CreatorMixin):
             host = get_host(self.client)
             derived_from_id = self.derived_from._id
             derived_from_url = self.derived_from.url.get("@id")
-            u = urlparse(derived_from_url)
+            u = urlsplit(derived_from_url)
             derived_from_url = u._replace(netloc=host).geturl()
             self.derived_from = Url(id=derived_from_id, url_id=derived_from_url)
 
@@ -706,7 +706,7 @@ class ImageObject:
     @property
     def is_absolute(self):
         """Whether content_url is an absolute or relative url."""
-        return bool(urlparse(self.content_url).netloc)
+        return bool(urlsplit(self.content_url).netloc)
 
 
 class OldCreatorMixinSchema(JsonLDSchema):
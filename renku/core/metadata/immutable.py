@@ -42,7 +42,12 @@ class Slots:
         return cls(**kwargs)
 
     def __getstate__(self):
-        return {name: getattr(self, name, None) for name in self.__class__.__all_slots__ if name != "__weakref__"}
+        # NOTE: Like persistent objects' ``_v_`` attributes, ``_v_`` slots are volatile and are not stored
+        return {
+            name: getattr(self, name, None)
+            for name in self.__class__.__all_slots__
+            if name != "__weakref__" and not name.startswith("_v_")
+        }
 
     def __setstate__(self, state):
         for name, value in state.items():
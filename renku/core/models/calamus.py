@@ -19,6 +19,7 @@
 
 import copy
 import inspect
+from datetime import datetime
 
 import marshmallow
 from calamus import fields
@@ -26,7 +27,7 @@ from calamus.schema import JsonLDSchema as CalamusJsonLDSchema
 from calamus.utils import normalize_type, normalize_value
 from marshmallow.base import SchemaABC
 
-from renku.core.utils.datetime8601 import fix_timezone
+from renku.core.utils.datetime8601 import fix_timezone, validate_iso8601
 
 prov = fields.Namespace("http://www.w3.org/ns/prov#")
 rdfs = fields.Namespace("http://www.w3.org/2000/01/rdf-schema#")
@@ -36,6 +37,8 @@ wfprov = fields.Namespace("http://purl.org/wf4ever/wfprov#")
 oa = fields.Namespace("http://www.w3.org/ns/oa#")
 dcterms = fields.Namespace("http://purl.org/dc/terms/")
 
+_DATE_FORMAT = "%Y-%m-%d"
+
 
 class JsonLDSchema(CalamusJsonLDSchema):
     """Base schema class for Renku."""
@@ -133,7 +136,35 @@ class StringList(fields.String):
         return super()._deserialize(value, attr, data, **kwargs)
 
 
-class DateTimeList(fields.DateTime):
+class DateTime(fields.DateTime):
+    """A DateTime field that parses ISO 8601 strings and short dates directly when possible."""
+
+    # NOTE: ``datetime.fromisoformat`` is not available in Python 3.6
+    _fromisoformat = getattr(datetime, "fromisoformat", None)
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        value = normalize_value(value)
+
+        if isinstance(value, str) and self.format in (None, "iso"):
+            # NOTE: Only use ``fromisoformat`` for ISO 8601 date-times that the generic parser accepts as well; other
+            # values (e.g. compact forms that newer Pythons support) go through the generic parser's validation
+            if self._fromisoformat is not None and validate_iso8601(value):
+                try:
+                    return self._fromisoformat(value)
+                except ValueError:
+                    # NOTE: Fall back to the generic parsers for formats that ``fromisoformat`` doesn't support
+                    pass
+            # NOTE: Parse short dates directly instead of failing the ISO parser and then trying ``extra_formats``
+            elif len(value) == 10 and _DATE_FORMAT in self.extra_formats:
+                try:
+                    return datetime.strptime(value, _DATE_FORMAT)
+                except ValueError:
+                    pass
+
+        return super()._deserialize(value, attr, data, **kwargs)
+
+
+class DateTimeList(DateTime):
     """A DateTime field that might be a list when deserializing."""
 
     def __init__(self, *args, **kwargs):
@@ -19,10 +19,11 @@
 
 import copy
 import os
+import re
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from urllib.parse import quote, urlparse
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import quote, urlsplit
 from uuid import uuid4
 
 import marshmallow
@@ -31,17 +32,31 @@ from marshmallow import EXCLUDE, pre_dump
 from renku.core import errors
 from renku.core.metadata.database import Database, Index, Persistent
 from renku.core.metadata.immutable import Immutable, Slots
-from renku.core.models.calamus import DateTimeList, JsonLDSchema, Nested, Uri, fields, prov, renku, schema, wfprov
+from renku.core.models.calamus import (
+    DateTime,
+    DateTimeList,
+    JsonLDSchema,
+    Nested,
+    Uri,
+    fields,
+    prov,
+    renku,
+    schema,
+    wfprov,
+)
 from renku.core.models.entity import Entity, EntitySchema
 from renku.core.models.provenance.agent import Person, PersonSchema, SoftwareAgent
 from renku.core.utils import communication
 from renku.core.utils.datetime8601 import fix_timezone, local_now, parse_date
 from renku.core.utils.urls import get_slug
 
+# NOTE: Matches exactly the names that ``get_slug`` leaves unchanged
+_VALID_SLUG_REGEX = re.compile(r"[a-z0-9]+(?:[._-][a-z0-9]+)*")
+
 
 def is_dataset_name_valid(name):
     """Check if name is a valid slug."""
-    return name and name == get_slug(name)
+    return bool(name) and _VALID_SLUG_REGEX.fullmatch(name) is not None and not name.endswith(".lock")
 
 
 def generate_default_name(dataset_title, dataset_version=None):
@@ -62,10 +77,14 @@ def generate_default_name(dataset_title, dataset_version=None):
     return get_slug(name)
 
 
-class Url:
+class Url(Slots):
     """Represents a schema URL reference."""
 
+    __slots__ = ("id", "url", "url_id", "url_str")
+
     def __init__(self, *, id: str = None, url: str = None, url_str: str = None, url_id: str = None):
+        super().__init__()
+
         self.id: str = id
         self.url: str = url
         self.url_str: str = url_str
@@ -87,7 +106,7 @@ class Url:
     def generate_id(url_str, url_id):
         """Generate an identifier for Url."""
         url = url_str or url_id
-        id = urlparse(url)._replace(scheme="").geturl().strip("/") if url else uuid4().hex
+        id = urlsplit(url)._replace(scheme="").geturl().strip("/") if url else uuid4().hex
         id = quote(id, safe="/")
 
         return f"/urls/{id}"
@@ -173,7 +192,8 @@ class ImageObject(Slots):
     @property
     def is_absolute(self):
         """Whether content_url is an absolute or relative url."""
-        return bool(urlparse(self.content_url).netloc)
+        # NOTE: A URL can have a netloc only if it contains '//'; this avoids parsing relative paths
+        return bool(self.content_url) and "//" in self.content_url and bool(urlsplit(self.content_url).netloc)
 
 
 class RemoteEntity(Slots):
@@ -270,13 +290,13 @@ class DatasetFile(Slots):
 
         NOTE: id is generated randomly and should not be included in this comparison.
         """
-        return (
-            self.based_on == other.based_on
-            and self.date_added == other.date_added
-            and self.date_removed == other.date_removed
-            and self.entity == other.entity
-            and self.is_external == other.is_external
-            and self.source == other.source
+        return (self.based_on, self.date_added, self.date_removed, self.entity, self.is_external, self.source) == (
+            other.based_on,
+            other.date_added,
+            other.date_removed,
+            other.entity,
+            other.is_external,
+            other.source,
         )
 
     def remove(self, date: datetime = None):
@@ -296,6 +316,9 @@ class DatasetFile(Slots):
 class Dataset(Persistent):
     """Represent a dataset."""
 
+    # NOTE: A volatile map from path to existing files; it is never stored in the database
+    _v_path_index = None
+
     def __init__(
         self,
         *,
@@ -477,18 +500,41 @@ class Dataset(Persistent):
     def find_file(self, path: Union[Path, str]) -> Optional[DatasetFile]:
         """Find a file in the dataset using its relative path."""
         path = str(path)
-        for file in self.dataset_files:
-            if str(file.entity.path) == path and not file.is_removed():
-                return file
+        file = self._get_path_index().get(path)
+        if file and file.is_removed():
+            # NOTE: File was removed after the index was built; another file with the same path might exist
+            self._v_path_index = None
+            file = self._get_path_index().get(path)
+
+        return file
+
+    def _get_path_index(self) -> Dict[str, DatasetFile]:
+        """Return a map from path to existing files; rebuild it if ``dataset_files`` was reassigned."""
+        if self._v_path_index is None or self._v_path_index[0] is not self.dataset_files:
+            index = {}
+            for file in self.dataset_files:
+                if not file.is_removed():
+                    index.setdefault(str(file.entity.path), file)
+            self._v_path_index = (self.dataset_files, index)
+
+        return self._v_path_index[1]
 
     def update_files_from(self, current_dataset: "Dataset", date: datetime = None):
         """Check `current_files` to reuse existing entries and mark removed files."""
-        new_files: Dict[str, DatasetFile] = {f.entity.path: f for f in self.files}
-        current_files: Dict[str, DatasetFile] = {f.entity.path: f for f in current_dataset.files}
+        # NOTE: Iterate ``dataset_files`` instead of ``files`` to avoid building extra lists
+        current_files: Dict[str, DatasetFile] = {
+            f.entity.path: f for f in current_dataset.dataset_files if not f.is_removed()
+        }
 
         files = []
-
-        for path, file in new_files.items():
+        paths = set()
+
+        # NOTE: Iterate in reverse to keep only the last entry of a path that was added more than once
+        for file in reversed(self.dataset_files):
+            path = file.entity.path
+            if file.is_removed() or path in paths:
+                continue
+            paths.add(path)
             # Use existing entries from `current_files` to avoid creating new ids
             current_file = current_files.pop(path, None)
             if current_file and file.is_equal_to(current_file):
@@ -496,6 +542,8 @@ class Dataset(Persistent):
             else:
                 files.append(file)
 
+        files.reverse()
+
         # NOTE: Whatever remains in `current_files` are removed in the newer version
         for removed_file in current_files.values():
             removed_file.remove(date)
@@ -562,12 +610,14 @@ class Dataset(Persistent):
                 new_files.append(file)
             elif file.entity.checksum != existing_file.entity.checksum or file.date_added != existing_file.date_added:
                 self.dataset_files.remove(existing_file)
+                self._get_path_index().pop(str(existing_file.entity.path), None)
                 new_files.append(file)
 
         if not new_files:
             return
 
         self.dataset_files += new_files
+        self._v_path_index = None
         self._p_changed = True
 
     def clear_files(self):
@@ -603,9 +653,9 @@ class DatasetsProvenance:
         self._has_database = has_database
 
     @property
-    def datasets(self) -> List[Dataset]:
+    def datasets(self) -> Iterable[Dataset]:
         """Return an iterator of datasets."""
-        return list(self._datasets.values())
+        return self._datasets.values()
 
     def get_by_id(self, id: str, immutable=False) -> Optional[Dataset]:
         """Return a dataset by its id."""
@@ -633,9 +683,12 @@ class DatasetsProvenance:
 
         return dataset.copy()
 
-    def get_provenance(self):
-        """Return the provenance for all datasets."""
-        return list(self._provenance_tails.values())
+    def get_provenance(self) -> Iterable[Dataset]:
+        """Return the provenance for all datasets.
+
+        NOTE: This is a lazy view over the index; it supports ``len`` and indexing but reflects later changes.
+        """
+        return self._provenance_tails.values()
 
     def get_previous_version(self, dataset: Dataset) -> Optional[Dataset]:
         """Return the previous version of a dataset if any."""
@@ -772,7 +825,7 @@ class DatasetTagSchema(JsonLDSchema):
 
     commit = fields.String(schema.location)
     dataset = fields.String(schema.about)
-    date_created = fields.DateTime(schema.startDate, missing=None, format="iso", extra_formats=("%Y-%m-%d",))
+    date_created = DateTime(schema.startDate, missing=None, format="iso", extra_formats=("%Y-%m-%d",))
     description = fields.String(schema.description, missing=None)
     id = fields.Id()
     name = fields.String(schema.name)
@@ -843,7 +896,7 @@ class DatasetFileSchema(JsonLDSchema):
 
     based_on = Nested(schema.isBasedOn, RemoteEntitySchema, missing=None)
     date_added = DateTimeList(schema.dateCreated, format="iso", extra_formats=("%Y-%m-%d",))
-    date_removed = fields.DateTime(prov.invalidatedAtTime, missing=None, format="iso")
+    date_removed = DateTime(prov.invalidatedAtTime, missing=None, format="iso")
     entity = Nested(prov.entity, EntitySchema)
     id = fields.Id()
     is_external = fields.Boolean(renku.external, missing=False)
@@ -861,9 +914,9 @@ class DatasetSchema(JsonLDSchema):
         unknown = EXCLUDE
 
     creators = Nested(schema.creator, PersonSchema, many=True)
-    date_created = fields.DateTime(schema.dateCreated, missing=None, format="iso", extra_formats=("%Y-%m-%d",))
-    date_removed = fields.DateTime(prov.invalidatedAtTime, missing=None, format="iso")
-    date_published = fields.DateTime(
+    date_created = DateTime(schema.dateCreated, missing=None, format="iso", extra_formats=("%Y-%m-%d",))
+    date_removed = DateTime(prov.invalidatedAtTime, missing=None, format="iso")
+    date_published = DateTime(
         schema.datePublished, missing=None, format="%Y-%m-%d", extra_formats=("iso", "%Y-%m-%dT%H:%M:%S")
     )
     # FIXME: Implement proper export
@@ -61,8 +61,12 @@ class Entity(Immutable):
         return f"/entities/{checksum}/{quoted_path}"
 
     @classmethod
-    def from_revision(cls, client, path: Union[Path, str], revision: str = None) -> "Entity":
-        """Return dependency from given path and revision."""
+    def from_revision(cls, client, path: Union[Path, str], revision: str = None, checksum: str = None) -> "Entity":
+        """Return dependency from given path and revision.
+
+        ``checksum`` can be passed when the object's hash at ``revision`` is already known (e.g. from
+        ``get_object_hashes``) to avoid looking it up again.
+        """
         revision = revision or "HEAD"
         assert isinstance(revision, str), f"Invalid revision: {revision}"
 
@@ -74,7 +78,7 @@ class Entity(Immutable):
             return cached_entry
 
         # TODO: What checksum we get at "HEAD" if object is staged but not committed
-        checksum = get_object_hash(repo=client.repo, revision=revision, path=path)
+        checksum = checksum or get_object_hash(repo=client.repo, revision=revision, path=path)
         # NOTE: If object was not found at a revision it's either removed or exists in a different revision; keep the
         # entity and use revision as checksum
         checksum = checksum or revision
@@ -31,6 +31,11 @@ from renku.core.models.git import get_user_info
 from renku.core.models.provenance import agents as old_agents
 from renku.version import __version__, version_url
 
+_EMAIL_REGEX = re.compile(r"[^@]+@[^@]+\.[^@]+")
+_PERSON_STRING_REGEX = re.compile(
+    r"([^<>\[\]]*)" r"(?:<{1}\s*(\S+@\S+\.\S+){0,1}\s*>{1}){0,1}\s*" r"(?:\[{1}(.*)\]{1}){0,1}"
+)
+
 
 class Agent(Slots):
     """Represent executed software."""
@@ -93,7 +98,7 @@ RENKU_AGENT = SoftwareAgent(id=version_url, name=f"renku {__version__}")
 class Person(Agent):
     """Represent a person."""
 
-    __slots__ = ("affiliation", "alternate_name", "email")
+    __slots__ = ("affiliation", "alternate_name", "email", "_v_full_identity")
 
     affiliation: str
     alternate_name: str
@@ -129,6 +134,11 @@ class Person(Agent):
     def __hash__(self):
         return hash((self.id, self.full_identity))
 
+    def __setattr__(self, name, value):
+        # NOTE: Invalidate the cached full identity since it's computed from other attributes
+        object.__setattr__(self, "_v_full_identity", None)
+        object.__setattr__(self, name, value)
+
     @classmethod
     def from_person(cls, person: Optional[old_agents.Person]) -> Optional["Person"]:
         """Create an instance from Person."""
@@ -163,8 +173,7 @@ class Person(Agent):
     @classmethod
     def from_string(cls, string):
         """Create an instance from a 'Name <email>' string."""
-        regex_pattern = r"([^<>\[\]]*)" r"(?:<{1}\s*(\S+@\S+\.\S+){0,1}\s*>{1}){0,1}\s*" r"(?:\[{1}(.*)\]{1}){0,1}"
-        name, email, affiliation = re.search(regex_pattern, string).groups()
+        name, email, affiliation = _PERSON_STRING_REGEX.search(string).groups()
         if name:
             name = name.strip()
         if affiliation:
@@ -203,15 +212,20 @@ class Person(Agent):
         """Check that the email is valid."""
         if not email:
             return
-        if not isinstance(email, str) or not re.match(r"[^@]+@[^@]+\.[^@]+", email):
+        if not isinstance(email, str) or not _EMAIL_REGEX.match(email):
             raise ValueError("Email address is invalid.")
 
     @staticmethod
     def get_full_identity(email, affiliation, name):
         """Return name, email, and affiliation."""
-        email = f" <{email}>" if email else ""
-        affiliation = f" [{affiliation}]" if affiliation else ""
-        return f"{name}{email}{affiliation}"
+        if email and affiliation:
+            return f"{name} <{email}> [{affiliation}]"
+        elif email:
+            return f"{name} <{email}>"
+        elif affiliation:
+            return f"{name} [{affiliation}]"
+
+        return str(name)
 
     @property
     def short_name(self):
@@ -229,7 +243,12 @@ class Person(Agent):
     @property
     def full_identity(self):
         """Return name, email, and affiliation."""
-        return self.get_full_identity(self.email, self.affiliation, self.name)
+        full_identity = getattr(self, "_v_full_identity", None)
+        if full_identity is None:
+            full_identity = self.get_full_identity(self.email, self.affiliation, self.name)
+            object.__setattr__(self, "_v_full_identity", full_identity)
+
+        return full_identity
 
 
 class PersonSchema(JsonLDSchema):
@@ -19,7 +19,7 @@
 
 import json
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Union
 
 from marshmallow import EXCLUDE
 from rdflib import ConjunctiveGraph
@@ -36,6 +36,8 @@ class ProvenanceGraph:
     def __init__(self, activities: List[Activity] = None):
         self.activities: List[Activity] = activities or []
 
+        # NOTE: Built on the first add since computing it loads all activities
+        self._activity_ids: Optional[Set[str]] = None
         self._custom_bindings: Dict[str, str] = {}
         self._graph: Optional[ConjunctiveGraph] = None
         self._loaded: bool = False
@@ -57,11 +59,20 @@ class ProvenanceGraph:
         """Add an Activity/ActivityCollection to the graph."""
         activity_collection = node if isinstance(node, ActivityCollection) else ActivityCollection(activities=[node])
 
+        if self._activity_ids is None:
+            self._activity_ids = {a.id for a in self.activities}
+
         for activity in activity_collection.activities:
-            assert not any([a for a in self.activities if a.id == activity.id]), f"Identifier exists {activity.id}"
+            assert activity.id not in self._activity_ids, f"Identifier exists {activity.id}"
             activity.order = self._order
             self._order += 1
             self.activities.append(activity)
+            self._activity_ids.add(activity.id)
+
+        # NOTE: Add new activities to an already created RDF graph since it's only parsed once from the file
+        if self._graph is not None:
+            data = ActivitySchema(flattened=True, many=True).dump(activity_collection.activities)
+            self._graph.parse(data=json.dumps(data), format="json-ld")
 
         self._p_changed = True
 
@@ -128,7 +139,7 @@ class ProvenanceGraph:
         return self._graph
 
     def _create_rdf_graph(self):
-        if self._graph:
+        if self._graph is not None:
             return
 
         self._graph = ConjunctiveGraph()
@@ -151,10 +162,7 @@ class ProvenanceGraph:
 
     def get_latest_plans_usages(self):
         """Return a list of tuples with path and check of all Usage paths."""
-        plan_orders = self.query(LATEST_PLAN_EXECUTION_ORDER)
-        usages = self.query(ALL_USAGES)
-
-        latest_usages = (u for u in usages for o in plan_orders if u[1] == o[1])
+        latest_usages = self.query(LATEST_PLANS_USAGES)
 
         return [(str(u[0]), str(u[-2]), str(u[-1])) for u in latest_usages]
 
@@ -177,22 +185,21 @@ class ProvenanceGraphSchema(JsonLDSchema):
     activities = Nested(schema.hasPart, ActivitySchema, many=True, missing=None)
 
 
-LATEST_PLAN_EXECUTION_ORDER = """
-    SELECT ?plan (MAX(?order) AS ?maxOrder)
-    WHERE
-    {
-        ?activity a prov:Activity .
-        ?activity prov:qualifiedAssociation/prov:hadPlan ?plan .
-        ?activity renku:order ?order
-    }
-    GROUP BY ?plan
-    """
-
-
-ALL_USAGES = """
-    SELECT ?plan ?order ?usage ?path ?checksum
+LATEST_PLANS_USAGES = """
+    SELECT ?plan ?usage ?path ?checksum
     WHERE
     {
+        {
+            SELECT ?plan (MAX(?order_) AS ?maxOrder)
+            WHERE
+            {
+                ?activity a prov:Activity .
+                ?activity prov:qualifiedAssociation/prov:hadPlan ?plan .
+                ?activity renku:order ?order_
+            }
+            GROUP BY ?plan
+        }
+        .
         ?activity a prov:Activity .
         ?activity prov:qualifiedAssociation/prov:hadPlan ?plan .
         ?activity renku:order ?order .
@@ -200,6 +207,7 @@ ALL_USAGES = """
         ?usage prov:entity ?entity .
         ?entity prov:atLocation ?path .
         ?entity renku:checksum ?checksum .
+        FILTER(?order = ?maxOrder)
     }
     """
 
@@ -17,9 +17,10 @@
 # limitations under the License.
 """Represent dependency graph."""
 
-from collections import deque
+import os
+from collections import defaultdict, deque
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 import networkx
 from marshmallow import EXCLUDE
@@ -40,6 +41,16 @@ class DependencyGraph:
 
         # NOTE: If we connect nodes then all ghost objects will be loaded which is not what we want
         self._graph = None
+        # NOTE: Map resolved output paths to the plans that generate them and resolved input paths (and all their
+        # parents) to the plans that use them; these are built along with the graph and used to find edges
+        self._producers: Dict[Path, List[Plan]] = defaultdict(list)
+        self._consumers: Dict[Path, List[Plan]] = defaultdict(list)
+        # NOTE: Map plans' similarity keys to plans; it's built on the first lookup since it loads all plans
+        self._similar_plans: Optional[Dict[tuple, Plan]] = None
+        # NOTE: Cache resolved paths and their ancestors for the lifetime of this graph. Keys include the working
+        # directory since relative paths resolve differently in each directory.
+        self._resolved_paths: Dict[Tuple[str, str], Path] = {}
+        self._ancestors: Dict[Tuple[str, str], FrozenSet[Path]] = {}
 
     @classmethod
     def from_database(cls, database: Database) -> "DependencyGraph":
@@ -52,7 +63,7 @@ class DependencyGraph:
     @property
     def graph(self) -> networkx.DiGraph:
         """A networkx.DiGraph containing all plans."""
-        if not self._graph:
+        if self._graph is None:
             self._graph = networkx.DiGraph()
             self._graph.add_nodes_from(self._plans.values())
             self._connect_all_nodes()
@@ -88,30 +99,70 @@ class DependencyGraph:
 
     def _find_similar_plan(self, plan: Plan) -> Optional[Plan]:
         """Search for a similar plan and return it."""
-        for p in self._plans.values():
-            if p.is_similar_to(plan):
-                return p
+        if self._similar_plans is None:
+            self._similar_plans = {}
+            for p in self._plans.values():
+                self._similar_plans.setdefault(p.get_similarity_key(), p)
+
+        return self._similar_plans.get(plan.get_similarity_key())
 
     def _add_helper(self, plan: Plan):
         self._plans.add(plan)
 
-        self.graph.add_node(plan)
-        self._connect_node_to_others(node=plan)
+        if self._similar_plans is not None:
+            self._similar_plans.setdefault(plan.get_similarity_key(), plan)
+
+        # NOTE: If the graph isn't built yet, the plan gets connected along with all other plans when it's built
+        if self._graph is not None:
+            self._graph.add_node(plan)
+            self._connect_node_to_others(node=plan)
+
+    def _index_node(self, node: Plan):
+        """Add a node's resolved input and output paths to the lookup indices."""
+        for o in node.outputs:
+            self._producers[self._resolve(o.default_value)].append(node)
+
+        paths = set()
+        for i in node.inputs:
+            paths.update(self._get_ancestors(i.default_value))
+
+        for path in paths:
+            self._consumers[path].append(node)
 
     def _connect_all_nodes(self):
-        for node in self.graph:
-            self._connect_node_to_others(node)
+        self._producers.clear()
+        self._consumers.clear()
+
+        for node in self._graph:
+            self._index_node(node)
+
+        for node in self._graph:
+            self._connect_to_consumers(node)
 
     def _connect_node_to_others(self, node: Plan):
-        for other_node in self.graph:
-            self._connect_two_nodes(from_=node, to_=other_node)
-            self._connect_two_nodes(from_=other_node, to_=node)
+        self._index_node(node)
+        self._connect_to_consumers(node)
+
+        producers = {}
+        for i in node.inputs:
+            for ancestor in self._get_ancestors(i.default_value):
+                for producer in self._producers.get(ancestor, ()):
+                    producers[producer] = None
+
+        for producer in producers:
+            self._connect_two_nodes(from_=producer, to_=node)
+
+    def _connect_to_consumers(self, node: Plan):
+        """Connect a node to all nodes that use its outputs."""
+        for o in node.outputs:
+            for consumer in self._consumers.get(self._resolve(o.default_value), ()):
+                self._graph.add_edge(node, consumer, name=o.default_value)
 
     def _connect_two_nodes(self, from_: Plan, to_: Plan):
         for o in from_.outputs:
             for i in to_.inputs:
-                if DependencyGraph._is_super_path(o.default_value, i.default_value):
-                    self.graph.add_edge(from_, to_, name=o.default_value)
+                if self._is_super_path(o.default_value, i.default_value):
+                    self._graph.add_edge(from_, to_, name=o.default_value)
 
     def visualize_graph(self):
         """Visualize graph using matplotlib."""
@@ -125,29 +176,54 @@ class DependencyGraph:
         """Create a PNG image from graph."""
         networkx.drawing.nx_pydot.to_pydot(self.graph).write_png(path)
 
-    @staticmethod
-    def _is_super_path(parent, child):
-        parent = Path(parent).resolve()
-        child = Path(child).resolve()
-        return parent == child or parent in child.parents
+    def _resolve(self, path) -> Path:
+        """Return the resolved path; paths are resolved against the current working directory."""
+        key = (os.getcwd(), str(path))
+        resolved = self._resolved_paths.get(key)
+        if resolved is None:
+            resolved = self._resolved_paths[key] = (Path(key[0]) / key[1]).resolve()
+
+        return resolved
+
+    def _get_ancestors(self, path) -> FrozenSet[Path]:
+        """Return a set of the resolved path and all of its parents."""
+        key = (os.getcwd(), str(path))
+        ancestors = self._ancestors.get(key)
+        if ancestors is None:
+            resolved = self._resolve(path)
+            ancestors = self._ancestors[key] = frozenset((resolved, *resolved.parents))
+
+        return ancestors
+
+    def _is_super_path(self, parent, child):
+        return self._resolve(parent) in self._get_ancestors(child)
+
+    def _get_node(self, plan_id) -> Optional[Plan]:
+        """Return a plan in the graph by its id."""
+        node = self._plans.get(plan_id)
+        return node if node is not None and node in self.graph else None
 
     def get_dependent_paths(self, plan_id, path):
         """Get a list of downstream paths."""
         nodes = deque()
-        node: Plan
-        for node in self.graph:
-            if plan_id == node.id and any(self._is_super_path(path, p.default_value) for p in node.inputs):
-                nodes.append(node)
+        node = self._get_node(plan_id)
+        if node is not None and any(self._is_super_path(path, p.default_value) for p in node.inputs):
+            nodes.append(node)
 
         paths = set()
+        visited = set()
+        successors = self.graph.succ
 
-        # TODO: This loops infinitely if there is a cycle in the graph
         while nodes:
             node = nodes.popleft()
+            if node in visited:
+                continue
+            visited.add(node)
+
             outputs_paths = [o.default_value for o in node.outputs]
             paths.update(outputs_paths)
 
-            nodes.extend(self.graph.successors(node))
+            nodes.extend(successors[node])
 
         return paths
 
@@ -160,16 +236,24 @@ class DependencyGraph:
                     return True
             return False
 
-        nodes = set()
-        nodes_with_deleted_inputs = set()
-        node: Plan
+        nodes_to_visit = []
         for plan_id, path, _ in modified_usages:
-            for node in self.graph:
-                if plan_id == node.id and any(self._is_super_path(path, p.default_value) for p in node.inputs):
-                    nodes.add(node)
-                    nodes.update(networkx.algorithms.dag.descendants(self.graph, node))
+            node = self._get_node(plan_id)
+            if node is not None and any(self._is_super_path(path, p.default_value) for p in node.inputs):
+                nodes_to_visit.append(node)
+
+        # NOTE: Collect all descendants of modified nodes in a single traversal
+        nodes = set()
+        successors = self.graph.succ
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            if node in nodes:
+                continue
+            nodes.add(node)
+            nodes_to_visit.extend(successors[node])
 
         sorted_nodes = []
+        nodes_with_deleted_inputs = set()
         for node in networkx.algorithms.dag.topological_sort(self.graph):
             if node in nodes:
                 if node_has_deleted_inputs(node):
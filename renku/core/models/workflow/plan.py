@@ -188,23 +188,17 @@ class Plan(Persistent):
 
     def is_similar_to(self, other: "Plan") -> bool:
         """Return true if plan has the same inputs/outputs/arguments as another plan."""
+        return self.get_similarity_key() == other.get_similarity_key()
 
-        def get_input_patterns(plan: Plan):
-            return {e.default_value for e in plan.inputs}
-
-        def get_output_patterns(plan: Plan):
-            return {e.default_value for e in plan.outputs}
-
-        def get_parameters(plan: Plan):
-            return {(a.position, a.prefix, a.default_value) for a in plan.parameters}
-
+    def get_similarity_key(self) -> tuple:
+        """Return a hashable key that is equal for plans with the same inputs/outputs/arguments."""
         # TODO: Check order of inputs/outputs/parameters as well after sorting by position
         return (
-            self.command == other.command
-            and set(self.success_codes) == set(other.success_codes)
-            and get_input_patterns(self) == get_input_patterns(other)
-            and get_output_patterns(self) == get_output_patterns(other)
-            and get_parameters(self) == get_parameters(other)
+            self.command,
+            frozenset(self.success_codes),
+            frozenset(e.default_value for e in self.inputs),
+            frozenset(e.default_value for e in self.outputs),
+            frozenset((a.position, a.prefix, a.default_value) for a in self.parameters),
         )
 
     def to_argv(self) -> List[Any]:
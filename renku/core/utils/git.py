@@ -22,7 +22,7 @@ import pathlib
 import urllib
 from pathlib import Path
 from subprocess import SubprocessError, run
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
 from git import Commit, Git, GitCommandError, Repo
 
@@ -136,6 +136,33 @@ def get_object_hash(repo: Repo, path: Union[Path, str], revision: str = None) ->
         return get_object_hash_from_submodules()
 
 
+def get_object_hashes(repo: Repo, paths: List[Union[Path, str]], revision: str = None) -> Dict[str, str]:
+    """Return git hashes of multiple objects at a revision using one git call per batch of paths.
+
+    Paths that cannot be found (e.g. because they are in a submodule) are not included in the result; use
+    ``get_object_hash`` for those.
+    """
+    revision = revision or "HEAD"
+    hashes = {}
+
+    for batch in split_paths(*[str(p) for p in paths]):
+        if not batch:
+            continue
+
+        try:
+            output = repo.git.ls_tree("-z", "--full-tree", revision, "--", *batch)
+        except GitCommandError:
+            continue
+
+        for entry in output.split("\0"):
+            if not entry:
+                continue
+            info, path = entry.split("\t", maxsplit=1)
+            hashes[path] = info.split()[2]
+
+    return hashes
+
+
 def find_previous_commit(
     repo: Repo, path: Union[Path, str], revision: str = None, return_first=False, full_history=False
 ) -> Optional[Commit]:
@@ -25,6 +25,7 @@ from renku.core.management.migrations.models import v9 as old_datasets
 from renku.core.models.dataset import Dataset, DatasetFile, DatasetTag, ImageObject, Language, RemoteEntity, Url
 from renku.core.models.entity import Entity
 from renku.core.models.provenance import agent as new_agents
+from renku.core.utils.git import get_object_hashes
 
 
 def convert_url(url: Optional[old_datasets.Url]) -> Optional[Url]:
@@ -65,9 +66,11 @@ def create_remote_entity(dataset_file: Optional[old_datasets.DatasetFile]) -> Op
     return RemoteEntity(commit_sha=commit_sha, path=dataset_file.path, url=dataset_file.url)
 
 
-def convert_dataset_file(dataset_file: old_datasets.DatasetFile, client, revision: str) -> Optional[DatasetFile]:
+def convert_dataset_file(
+    dataset_file: old_datasets.DatasetFile, client, revision: str, checksum: str = None
+) -> Optional[DatasetFile]:
     """Convert old DatasetFile to new DatasetFile if available at revision."""
-    entity = Entity.from_revision(client=client, path=dataset_file.path, revision=revision)
+    entity = Entity.from_revision(client=client, path=dataset_file.path, revision=revision, checksum=checksum)
     if not entity:
         return
 
@@ -85,17 +88,15 @@ def convert_dataset(dataset: old_datasets.Dataset, client, revision: str) -> Dat
 
     def convert_dataset_files(files: List[old_datasets.DatasetFile]) -> List[DatasetFile]:
         """Create instances from old DatasetFile."""
-        dataset_files = []
         files = {f.path: f for f in files}  # NOTE: To make sure there are no duplicate paths
-
-        for file in files.values():
-            new_file = convert_dataset_file(dataset_file=file, client=client, revision=revision)
-            if not new_file:
-                continue
-
-            dataset_files.append(new_file)
-
-        return dataset_files
+        # NOTE: Look up all checksums at once instead of running one git command per file
+        checksums = get_object_hashes(repo=client.repo, paths=list(files.keys()), revision=revision)
+        new_files = (
+            convert_dataset_file(dataset_file=f, client=client, revision=revision, checksum=checksums.get(str(path)))
+            for path, f in files.items()
+        )
+
+        return [f for f in new_files if f]
 
     def convert_derived_from(derived_from: Optional[old_datasets.Url]) -> Optional[str]:
         """Return Dataset.id from `derived_from` url."""
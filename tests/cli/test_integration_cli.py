@@ -61,45 +61,24 @@ def test_renku_clone(runner, monkeypatch, url):
 @pytest.mark.integration
 @flaky(max_runs=10, min_passes=1)
 @pytest.mark.parametrize("url", ["https://dev.renku.ch/gitlab/renku-testing/project-9"])
-def test_renku_clone_with_config(tmp_path, url):
-    """Test cloning of a Renku repo and existence of required settings."""
-    with chdir(tmp_path):
-        repo, _ = (
-            project_clone_command()
-            .build()
-            .execute(url, config={"user.name": "sam", "user.email": "s@m.i", "filter.lfs.custom": "0"})
-        ).output
-
-        assert "master" == repo.active_branch.name
-        reader = repo.config_reader()
-        reader.values()
-
-        lfs_config = dict(reader.items("filter.lfs"))
-        assert "0" == lfs_config.get("custom")
-
-
-@pytest.mark.integration
-@flaky(max_runs=10, min_passes=1)
-@pytest.mark.parametrize("url", ["https://dev.renku.ch/gitlab/renku-testing/project-9"])
-def test_renku_clone_checkout_rev(tmp_path, url):
-    """Test cloning of a repo checking out a rev with static config."""
+@pytest.mark.parametrize("rev", [None, "97f907e1a3f992d4acdc97a35df73b8affc917a6"])
+def test_renku_clone_with_config(tmp_path, url, rev):
+    """Test cloning of a Renku repo with static config and optionally checking out a rev."""
     with chdir(tmp_path):
         repo, _ = (
             project_clone_command()
             .build()
             .execute(
-                url,
-                config={"user.name": "sam", "user.email": "s@m.i", "filter.lfs.custom": "0"},
-                checkout_rev="97f907e1a3f992d4acdc97a35df73b8affc917a6",
+                url, config={"user.name": "sam", "user.email": "s@m.i", "filter.lfs.custom": "0"}, checkout_rev=rev
             )
         ).output
 
-        assert "97f907e1a3f992d4acdc97a35df73b8affc917a6" == str(repo.head.commit)
-        reader = repo.config_reader()
-        reader.values()
-
-        lfs_config = dict(reader.items("filter.lfs"))
-        assert "0" == lfs_config.get("custom")
+        if rev:
+            assert rev == str(repo.head.commit)
+        else:
+            assert "master" == repo.active_branch.name
+        reader = repo.config_reader("repository")
+        assert "0" == reader.get("filter.lfs", "custom")
 
 
 @pytest.mark.integration
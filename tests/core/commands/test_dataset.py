@@ -30,7 +30,8 @@ from renku.core import errors
 from renku.core.commands.dataset import add_to_dataset, create_dataset, file_unlink, list_datasets, list_files
 from renku.core.errors import ParameterError
 from renku.core.management.repository import DEFAULT_DATA_DIR as DATA_DIR
-from renku.core.models.dataset import Dataset
+from renku.core.models.dataset import Dataset, DatasetFile, ImageObject
+from renku.core.models.entity import Entity
 from renku.core.models.provenance.agent import Person
 from renku.core.utils.contexts import chdir
 from renku.core.utils.urls import get_slug
@@ -260,21 +261,81 @@ def test_dataset_name_slug(name, slug):
     assert slug == get_slug(name)
 
 
+def test_dataset_find_file():
+    """Test finding files in a dataset after adding, removing and replacing them."""
+    file_a = DatasetFile(entity=Entity(checksum="1", path="data/my-data/a"))
+    file_b = DatasetFile(entity=Entity(checksum="2", path="data/my-data/b"))
+    dataset = Dataset(name="my-data", dataset_files=[file_a, file_b])
+
+    assert file_a is dataset.find_file("data/my-data/a")
+    assert file_b is dataset.find_file(Path("data/my-data/b"))
+    assert dataset.find_file("data/my-data/c") is None
+
+    dataset.unlink_file("data/my-data/a")
+
+    assert dataset.find_file("data/my-data/a") is None
+
+    new_file_a = DatasetFile(entity=Entity(checksum="3", path="data/my-data/a"))
+    new_file_b = DatasetFile(entity=Entity(checksum="4", path="data/my-data/b"))
+    dataset.add_or_update_files([new_file_a, new_file_b])
+
+    assert new_file_a is dataset.find_file("data/my-data/a")
+    assert new_file_b is dataset.find_file("data/my-data/b")
+
+    dataset.dataset_files = [file_b]
+
+    assert dataset.find_file("data/my-data/a") is None
+    assert file_b is dataset.find_file("data/my-data/b")
+
+
+def test_dataset_update_files_from_with_duplicate_paths():
+    """Test only the last file is kept when the same path is added more than once."""
+    file_a = DatasetFile(entity=Entity(checksum="1", path="data/my-data/a"))
+    file_b = DatasetFile(entity=Entity(checksum="2", path="data/my-data/b"))
+    current_dataset = Dataset(name="my-data", dataset_files=[file_a, file_b])
+
+    new_file_a = DatasetFile(entity=Entity(checksum="3", path="data/my-data/a"))
+    duplicate_file_a = DatasetFile(entity=Entity(checksum="4", path="data/my-data/a"))
+    dataset = Dataset(name="my-data", dataset_files=[file_b.copy(), new_file_a, duplicate_file_a])
+
+    dataset.update_files_from(current_dataset)
+
+    assert [file_b, duplicate_file_a] == dataset.dataset_files
+
+
+@pytest.mark.parametrize(
+    "content_url, is_absolute",
+    [
+        ("https://example.com/image.png", True),
+        ("//example.com/image.png", True),
+        ("data/my-data/image.png", False),
+        ("/data//image.png", False),
+        ("", False),
+        (None, False),
+    ],
+)
+def test_image_object_is_absolute(content_url, is_absolute):
+    """Test detecting absolute image URLs."""
+    image = ImageObject(content_url=content_url, id="/images/0", position=0)
+
+    assert is_absolute is image.is_absolute
+
+
 def test_datasets_provenance_for_old_projects(old_client_before_database):
     """Test accessing DatasetsProvenance in an un-migrated project."""
     datasets_provenance = old_client_before_database.get_datasets_provenance()
 
     assert datasets_provenance.get_by_name("local") is None
-    assert [] == datasets_provenance.datasets
-    assert [] == datasets_provenance.get_provenance()
+    assert [] == list(datasets_provenance.datasets)
+    assert [] == list(datasets_provenance.get_provenance())
 
     dataset = Dataset(name="my-data")
     datasets_provenance.add_or_update(dataset)
 
     assert datasets_provenance.get_by_name("my-data") is None
-    assert [] == datasets_provenance.datasets
-    assert [] == datasets_provenance.get_provenance()
+    assert [] == list(datasets_provenance.datasets)
+    assert [] == list(datasets_provenance.get_provenance())
 
     datasets_provenance.remove(dataset)
 
-    assert [] == datasets_provenance.get_provenance()
+    assert [] == list(datasets_provenance.get_provenance())
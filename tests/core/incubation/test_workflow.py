@@ -18,6 +18,7 @@
 """Test workflow commands."""
 
 from renku.cli import cli
+from renku.core.incubation.graph import remove_workflow
 from tests.utils import format_result_exception
 
 
@@ -31,5 +32,4 @@ def test_workflow_remove_command(runner, project):
     result = runner.invoke(cli, ["run", "--success-code", "0", "--no-output", "--name", workflow_name, "echo", "foo"])
     assert 0 == result.exit_code, format_result_exception(result)
 
-    result = runner.invoke(cli, ["graph", "workflow", "remove", "--force", workflow_name])
-    assert 0 == result.exit_code, format_result_exception(result)
+    remove_workflow().build().execute(name=workflow_name, force=True)
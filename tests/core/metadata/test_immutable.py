@@ -43,6 +43,12 @@ class C(Immutable):
     __slots__ = ("c_member",)
 
 
+class D(Slots):
+    """Test class."""
+
+    __slots__ = ("d_member", "_v_member")
+
+
 def test_instantiate():
     """Test instantiating Slots subclasses."""
     b = B(a_member=42, b_member=43)
@@ -73,6 +79,14 @@ def test_get_all_slots():
     assert {"b_member", "a_member", "__weakref__"} == set(B.__all_slots__)
 
 
+def test_volatile_slots_are_not_in_state():
+    """Test slots that start with ``_v_`` are not included in an object's state."""
+    d = D(d_member=42, _v_member=43)
+
+    assert {"d_member": 42} == d.__getstate__()
+    assert 43 == d._v_member
+
+
 def test_immutable_object_id():
     """Test Immutable subclasses have an `id` field."""
     c = C(id=42, c_member=43)
@@ -18,6 +18,7 @@
 """Test agents."""
 import pytest
 
+from renku.core.models.provenance.agent import Person as NewPerson
 from renku.core.models.provenance.agents import Person
 
 
@@ -51,3 +52,27 @@ def test_construct_person(value, has_name, has_email, has_affiliation):
         assert "Some Affiliation" == p.affiliation
     else:
         assert p.affiliation is None
+
+
+def test_person_full_identity_is_updated():
+    """Test cached full identity is updated when person's attributes change."""
+    person = NewPerson(name="John Doe", email="john.doe@mail.ch", affiliation="Some Affiliation")
+    same_person = NewPerson(name="John Doe", email="john.doe@mail.ch", affiliation="Some Affiliation")
+
+    assert "John Doe <john.doe@mail.ch> [Some Affiliation]" == person.full_identity
+    assert same_person == person
+    assert hash(same_person) == hash(person)
+    assert "_v_full_identity" not in person.__getstate__()
+
+    person.name = "Jane Doe"
+    person.email = "jane.doe@mail.ch"
+    person.affiliation = "Other Affiliation"
+
+    assert "Jane Doe <jane.doe@mail.ch> [Other Affiliation]" == person.full_identity
+    assert same_person != person
+
+    updated_person = NewPerson(id=person.id, name="Jane Doe", email="jane.doe@mail.ch", affiliation="Other Affiliation")
+
+    assert updated_person == person
+    assert hash(updated_person) == hash(person)
+    assert "_v_full_identity" not in person.__getstate__()
@@ -17,9 +17,12 @@
 # limitations under the License.
 """Test Calamus model classes."""
 
+from datetime import datetime, timedelta, timezone
+
 import pytest
+from marshmallow import ValidationError
 
-from renku.core.models.calamus import JsonLDSchema, Uri, fields
+from renku.core.models.calamus import DateTime, JsonLDSchema, Uri, fields
 
 
 @pytest.mark.parametrize("value", [{"field": "http://datascience.ch"}, "http://datascience.ch"])
@@ -71,3 +74,87 @@ def test_uri_field_deserialization(value):
     entity = OldEntitySchema().load(data)
 
     assert entity.field == value
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2021-05-10T12:30:45+02:00", datetime(2021, 5, 10, 12, 30, 45, tzinfo=timezone(timedelta(hours=2)))),
+        ("2021-05-10T12:30:45.123456", datetime(2021, 5, 10, 12, 30, 45, 123456)),
+        ("2021-05-10", datetime(2021, 5, 10)),
+    ],
+)
+def test_datetime_field_deserialization(value, expected):
+    """Test deserialization of DateTime fields."""
+
+    class Entity:
+        def __init__(self, field):
+            self.field = field
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class EntitySchema(JsonLDSchema):
+        field = DateTime(schema.field, format="iso", extra_formats=("%Y-%m-%d",))
+
+        class Meta:
+            rdf_type = schema.Entity
+            model = Entity
+
+    data = {"@type": ["http://schema.org/Entity"], "http://schema.org/field": value}
+
+    entity = EntitySchema().load(data)
+
+    assert entity.field == expected
+
+
+@pytest.mark.parametrize(
+    "value", ["not a date", "2021-13-45T12:30:45", "20210510T123045", "2021-05-10T12:30:45+2", "2021-05-10T1230"]
+)
+def test_datetime_field_deserialization_invalid_value(value):
+    """Test deserialization of malformed DateTime fields fails."""
+
+    class Entity:
+        def __init__(self, field):
+            self.field = field
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class EntitySchema(JsonLDSchema):
+        field = DateTime(schema.field, format="iso")
+
+        class Meta:
+            rdf_type = schema.Entity
+            model = Entity
+
+    data = {"@type": ["http://schema.org/Entity"], "http://schema.org/field": value}
+
+    with pytest.raises(ValidationError):
+        EntitySchema().load(data)
+
+
+def test_datetime_field_deserialization_short_date(monkeypatch):
+    """Test short dates are parsed without trying the generic parsers first."""
+
+    def raise_error(*_, **__):
+        raise AssertionError("Generic parser should not be called")
+
+    class Entity:
+        def __init__(self, field):
+            self.field = field
+
+    schema = fields.Namespace("http://schema.org/")
+
+    class EntitySchema(JsonLDSchema):
+        field = DateTime(schema.field, format="iso", extra_formats=("%Y-%m-%d",))
+
+        class Meta:
+            rdf_type = schema.Entity
+            model = Entity
+
+    monkeypatch.setattr(fields.DateTime, "_deserialize", raise_error)
+
+    data = {"@type": ["http://schema.org/Entity"], "http://schema.org/field": "2021-05-10"}
+
+    entity = EntitySchema().load(data)
+
+    assert datetime(2021, 5, 10) == entity.field
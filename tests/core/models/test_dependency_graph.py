@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018-2021 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test DependencyGraph."""
+
+from pathlib import Path
+
+import pytest
+
+from renku.core.metadata.database import Index
+from renku.core.models.workflow.dependency_graph import DependencyGraph
+from renku.core.models.workflow.parameter import CommandInput, CommandOutput
+from renku.core.models.workflow.plan import Plan
+
+
+@pytest.fixture(autouse=True)
+def working_directory(tmp_path, monkeypatch):
+    """Run tests in an empty directory since paths are resolved against the current working directory."""
+    monkeypatch.chdir(tmp_path)
+
+
+def _create_plan(name, inputs=(), outputs=()):
+    id = f"https://renku.ch/plans/{name}"
+    return Plan(
+        id=id,
+        name=name,
+        command=name,
+        inputs=[CommandInput(id=f"{id}/inputs/{i}", default_value=p) for i, p in enumerate(inputs)],
+        outputs=[CommandOutput(id=f"{id}/outputs/{i}", default_value=p) for i, p in enumerate(outputs)],
+    )
+
+
+def _create_dependency_graph(*plans):
+    index = Index(name="plans", object_type=Plan, attribute="id")
+    for plan in plans:
+        index.add(plan)
+
+    return DependencyGraph(plans=index)
+
+
+def _get_edges(dependency_graph):
+    return {(u.name, v.name): data["name"] for u, v, data in dependency_graph.graph.edges(data=True)}
+
+
+def _get_pairwise_edges(plans):
+    """Connect every pair of plans when an output is the same as or a parent of an input."""
+    edges = {}
+    for from_ in plans:
+        for to_ in plans:
+            for o in from_.outputs:
+                for i in to_.inputs:
+                    parent = Path(o.default_value).resolve()
+                    child = Path(i.default_value).resolve()
+                    if parent == child or parent in child.parents:
+                        edges[(from_.name, to_.name)] = o.default_value
+
+    return edges
+
+
+def test_output_directory_connects_to_inputs_inside_it():
+    """Test an output directory is connected to plans that use files inside it."""
+    plans = [
+        _create_plan("a", inputs=["input"], outputs=["data"]),
+        _create_plan("b", inputs=["data/file"], outputs=["result"]),
+        _create_plan("c", inputs=["data-other/file"], outputs=["other"]),
+        _create_plan("d", inputs=["./data/../result"]),
+    ]
+
+    edges = _get_edges(_create_dependency_graph(*plans))
+
+    assert {("a", "b"): "data", ("b", "d"): "result"} == edges
+    assert _get_pairwise_edges(plans) == edges
+
+
+def test_add_plan_to_created_graph():
+    """Test a plan added after the graph is created is connected to existing plans."""
+    existing_plans = [
+        _create_plan("a", inputs=["input"], outputs=["data"]),
+        _create_plan("c", inputs=["result/file"], outputs=["final"]),
+    ]
+    dependency_graph = _create_dependency_graph(*existing_plans)
+    assert {} == _get_edges(dependency_graph)
+
+    new_plan = _create_plan("b", inputs=["data/file"], outputs=["result"])
+    dependency_graph.add(new_plan)
+
+    edges = _get_edges(dependency_graph)
+
+    assert {("a", "b"): "data", ("b", "c"): "result"} == edges
+    assert _get_pairwise_edges(existing_plans + [new_plan]) == edges
+    assert _get_edges(_create_dependency_graph(*existing_plans, new_plan)) == edges
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_edge_name_with_multiple_matching_outputs(incremental):
+    """Test edge's name is the last output that matches an input when multiple outputs match."""
+    plans = [
+        _create_plan("a", outputs=["data", "data/file", "other"]),
+        _create_plan("b", outputs=["data/file", "data"]),
+        _create_plan("c", inputs=["data/file/x"]),
+    ]
+
+    if incremental:
+        dependency_graph = _create_dependency_graph(plans[0])
+        assert {} == _get_edges(dependency_graph)
+        for plan in plans[1:]:
+            dependency_graph.add(plan)
+    else:
+        dependency_graph = _create_dependency_graph(*plans)
+
+    edges = _get_edges(dependency_graph)
+
+    assert {("a", "c"): "data/file", ("b", "c"): "data"} == edges
+    assert _get_pairwise_edges(plans) == edges
+
+
+def test_get_dependent_paths_with_diamond_dependency():
+    """Test paths of plans that are reachable through multiple paths are reported once."""
+    a = _create_plan("a", inputs=["input"], outputs=["data"])
+    b = _create_plan("b", inputs=["data"], outputs=["left"])
+    c = _create_plan("c", inputs=["data"], outputs=["right"])
+    d = _create_plan("d", inputs=["left", "right"], outputs=["result"])
+    e = _create_plan("e", inputs=["unrelated"], outputs=["other"])
+    dependency_graph = _create_dependency_graph(a, b, c, d, e)
+
+    paths = dependency_graph.get_dependent_paths(a.id, "input")
+
+    assert {"data", "left", "right", "result"} == paths
+    assert set() == dependency_graph.get_dependent_paths(a.id, "unrelated")
+
+
+def test_get_dependent_paths_with_cycle():
+    """Test dependent paths are found when there is a cycle in the graph."""
+    a = _create_plan("a", inputs=["input", "feedback"], outputs=["data"])
+    b = _create_plan("b", inputs=["data"], outputs=["feedback", "result"])
+    dependency_graph = _create_dependency_graph(a, b)
+
+    paths = dependency_graph.get_dependent_paths(a.id, "input")
+
+    assert {"data", "feedback", "result"} == paths
+
+
+def test_get_downstream():
+    """Test modified plans are returned in topological order and plans with deleted inputs separately."""
+    # NOTE: Names are in reverse order of dependencies so that the result isn't ordered by chance
+    first = _create_plan("c", inputs=["input"], outputs=["data"])
+    second = _create_plan("b", inputs=["data"], outputs=["intermediate"])
+    third = _create_plan("a", inputs=["intermediate"], outputs=["result"])
+    with_deleted_input = _create_plan("d", inputs=["data", "deleted/file"], outputs=["other"])
+    unrelated = _create_plan("e", inputs=["input"], outputs=["unrelated"])
+    dependency_graph = _create_dependency_graph(first, second, third, with_deleted_input, unrelated)
+
+    plans, plans_with_deleted_inputs = dependency_graph.get_downstream(
+        modified_usages=[(first.id, "input", "42")], deleted_usages=[(with_deleted_input.id, "deleted", "43")]
+    )
+
+    assert [first, second, third] == plans
+    assert [with_deleted_input] == plans_with_deleted_inputs
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright 2018-2021 - Swiss Data Science Center (SDSC)
+# A partnership between École Polytechnique Fédérale de Lausanne (EPFL) and
+# Eidgenössische Technische Hochschule Zürich (ETHZ).
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test ProvenanceGraph."""
+
+from renku.core.models.entity import Entity
+from renku.core.models.provenance.activity import Activity, Association, Usage
+from renku.core.models.provenance.provenance_graph import ProvenanceGraph
+from renku.core.models.workflow.plan import Plan
+
+
+def _create_plan(name):
+    return Plan(id=f"https://renku.ch/plans/{name}", name=name)
+
+
+def _create_activity(plan, order, paths, checksum="42"):
+    id = f"https://renku.ch/activities/{order}"
+    usages = [Usage(entity=Entity(checksum=checksum, path=p), id=f"{id}/usages/{i}") for i, p in enumerate(paths)]
+
+    return Activity(
+        id=id, association=Association(id=Association.generate_id(id), plan=plan), order=order, usages=usages
+    )
+
+
+def test_add_activity_to_created_rdf_graph(tmp_path):
+    """Test activities added after the RDF graph is created are included in queries."""
+    path = tmp_path / "provenance.json"
+    plan_a = _create_plan("a")
+    ProvenanceGraph(activities=[_create_activity(plan_a, order=1, paths=["data/a"])]).to_json(path)
+
+    provenance_graph = ProvenanceGraph.from_json(path, lazy=True)
+
+    assert [(plan_a.id, "data/a", "42")] == provenance_graph.get_latest_plans_usages()
+
+    plan_b = _create_plan("b")
+    provenance_graph.add(_create_activity(plan_b, order=2, paths=["data/b"]))
+
+    assert {(plan_a.id, "data/a", "42"), (plan_b.id, "data/b", "42")} == set(
+        provenance_graph.get_latest_plans_usages()
+    )
+
+
+def test_get_latest_plans_usages(tmp_path):
+    """Test only usages of the latest execution of each plan are returned."""
+    path = tmp_path / "provenance.json"
+    plan_a = _create_plan("a")
+    plan_b = _create_plan("b")
+    activities = [
+        _create_activity(plan_a, order=1, paths=["data/a-1"], checksum="1"),
+        _create_activity(plan_b, order=2, paths=["data/b-2", "data/shared"], checksum="2"),
+        _create_activity(plan_a, order=3, paths=["data/a-3"], checksum="3"),
+        _create_activity(plan_b, order=4, paths=["data/b-4"], checksum="4"),
+    ]
+    ProvenanceGraph(activities=activities).to_json(path)
+
+    latest_usages = ProvenanceGraph.from_json(path, lazy=True).get_latest_plans_usages()
+
+    assert {(plan_a.id, "data/a-3", "3"), (plan_b.id, "data/b-4", "4")} == set(latest_usages)
+    assert sorted([plan_a.id, plan_b.id]) == sorted(u[0] for u in latest_usages)
@@ -19,6 +19,7 @@
 
 import os
 
+from renku.core.utils.git import get_object_hash, get_object_hashes
 from renku.core.utils.urls import get_host
 
 
@@ -34,3 +35,18 @@ def test_hostname():
             os.environ["RENKU_DOMAIN"] = renku_domain
         else:
             del os.environ["RENKU_DOMAIN"]
+
+
+def test_get_object_hashes(client):
+    """Test getting hashes of multiple objects at once."""
+    (client.path / "data" / "sub").mkdir(parents=True)
+    (client.path / "data" / "file").write_text("file")
+    (client.path / "data" / "sub" / "with space").write_text("with space")
+    client.repo.git.add("--all")
+    client.repo.index.commit("Add files")
+
+    paths = ["data/file", "data/sub/with space"]
+
+    hashes = get_object_hashes(repo=client.repo, paths=paths + ["non-existing"])
+
+    assert {p: get_object_hash(repo=client.repo, path=p) for p in paths} == hashes
@@ -23,7 +23,7 @@ import shutil
 
 import pytest
 
-from tests.utils import format_result_exception
+from tests.utils import copy_tree, delete_in_background, format_result_exception
 
 
 @contextlib.contextmanager
@@ -40,10 +40,7 @@ def _isolated_filesystem(tmpdir, name=None, delete=True):
             yield t
         finally:
             if delete:
-                try:
-                    shutil.rmtree(t)
-                except OSError:  # noqa: B014
-                    pass
+                delete_in_background(t)
 
 
 @pytest.fixture()
@@ -62,48 +59,42 @@ def instance_path(renku_path, monkeypatch):
         yield renku_path
 
 
-@pytest.fixture()
-def repository(tmpdir):
-    """Yield a Renku repository."""
+@pytest.fixture(scope="session")
+def repository_template(tmpdir_factory):
+    """Initialize a Renku repository once per session; ``repository`` fixture copies it for each test."""
     from click.testing import CliRunner
 
     from renku.cli import cli
 
     runner = CliRunner()
-    with _isolated_filesystem(tmpdir, delete=True) as project_path:
+    with _isolated_filesystem(tmpdir_factory.mktemp("repository_template"), delete=False) as project_path:
         result = runner.invoke(cli, ["init", ".", "--template-id", "python-minimal"], "\n", catch_exceptions=False)
         assert 0 == result.exit_code, format_result_exception(result)
 
+    return str(project_path)
+
+
+@pytest.fixture()
+def repository(tmpdir, repository_template):
+    """Yield a Renku repository."""
+    with _isolated_filesystem(tmpdir, delete=True) as project_path:
+        copy_tree(repository_template, str(project_path))
+
         yield os.path.realpath(project_path)
 
 
 @pytest.fixture
 def project(repository):
     """Create a test project."""
-    from click.testing import CliRunner
-    from git import Repo
-
-    from renku.cli import cli
     from renku.core.utils.contexts import chdir
 
-    runner = CliRunner()
-
-    repo = Repo(repository, search_parent_directories=True)
-    commit = repo.head.commit
-
+    # NOTE: The repository is a fresh copy for each test and is deleted afterwards, so there is nothing to reset
     with chdir(repository):
         yield repository
 
-        os.chdir(repository)
-        repo.head.reset(commit, index=True, working_tree=True)
-        # INFO: remove any extra non-tracked files (.pyc, etc)
-        repo.git.clean("-xdff")
-
-        assert 0 == runner.invoke(cli, ["githooks", "install", "--force"]).exit_code
-
 
 @pytest.fixture
-def client(project, global_config_dir):
+def client(project, global_config_dir, monkeypatch):
     """Return a Renku repository."""
     from renku.core.management import LocalClient
     from renku.core.models.enums import ConfigFilter
@@ -116,8 +107,6 @@ def client(project, global_config_dir):
             return "False"
         return original_get_value(self, section, key, config_filter=config_filter)
 
-    LocalClient.get_value = mocked_get_value
+    monkeypatch.setattr(LocalClient, "get_value", mocked_get_value)
 
     yield LocalClient(path=project)
-
-    LocalClient.get_value = original_get_value
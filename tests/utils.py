@@ -17,8 +17,10 @@
 # limitations under the License.
 """Test utility functions."""
 import os
+import shutil
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from typing import Optional
 
@@ -27,6 +29,10 @@ import pytest
 from renku.core.metadata.database import Database
 from renku.core.models.dataset import Dataset, DatasetsProvenance
 
+_deletion_executor = ThreadPoolExecutor(max_workers=4)
+# NOTE: Leave test directories in place and let pytest remove old base temporary directories
+_LAZY_CLEANUP = os.getenv("RENKU_TESTS_LAZY_CLEANUP", "").lower() in ("1", "true", "yes")
+
 
 def raises(error):
     """Wrapper around pytest.raises to support None."""
@@ -119,6 +125,33 @@ def get_datasets_provenance(client) -> DatasetsProvenance:
     return DatasetsProvenance(database)
 
 
+def copy_tree(source, destination):
+    """Copy content of ``source`` directory into an existing ``destination`` directory."""
+    for name in os.listdir(source):
+        source_path = os.path.join(source, name)
+        destination_path = os.path.join(destination, name)
+        if os.path.isdir(source_path) and not os.path.islink(source_path):
+            shutil.copytree(source_path, destination_path, symlinks=True)
+        else:
+            shutil.copy2(source_path, destination_path, follow_symlinks=False)
+
+
+def delete_in_background(path):
+    """Delete a directory in a background thread so that the next test doesn't wait for it.
+
+    Nothing is deleted if ``RENKU_TESTS_LAZY_CLEANUP`` environment variable is set to ``1``, ``true`` or ``yes``.
+    """
+    if _LAZY_CLEANUP:
+        return
+
+    _deletion_executor.submit(shutil.rmtree, str(path), ignore_errors=True)
+
+
+def wait_for_background_deletions():
+    """Wait until all directories passed to ``delete_in_background`` are deleted."""
+    _deletion_executor.shutdown(wait=True)
+
+
 def format_result_exception(result):
     """Format a `runner.invoke` exception result into a nice string repesentation."""
 